@@ -1,13 +1,12 @@
 import pygame
 import random
 import time
-import asyncio
 pygame.init()
 clock = pygame.time.Clock()
 screen = pygame.display.set_mode((1200,800))
 pygame.display.set_caption('py_simulation test')
-playerimg = pygame.image.load('pixil-frame-0 (1).png')
-playerimg2 = pygame.image.load('pixil-frame-0.png')
+playerimg = pygame.image.load('pixil-frame-0 (1).png').convert_alpha()
+playerimg2 = pygame.image.load('pixil-frame-0.png').convert_alpha()
 playerX = 380 #380
 playerY = 270#270
 oplayerx=270
@@ -17,13 +16,14 @@ changey = -.1
 ochangex = 0
 ochangey = 0
 green = 56,69,45
-async def orbit(x,y):
+impact_dist2 = 4 #squared pixel distance that counts as a hit
+def orbit(x,y):
     screen.blit(playerimg2, (x, y))
 
-async def player(x,y):
+def player(x,y):
     screen.blit(playerimg,(x,y))
 
-async def ranmove():
+def ranmove():
     global oplayerx
     global oplayery
     global changex
@@ -41,7 +41,7 @@ async def ranmove():
         changey += -0.00003
     if playerY < oplayery:
         changey += 0.00003
-async def ranmove2():
+def ranmove2():
     global oplayerx
     global oplayery
     #oplayerx+=.03
@@ -50,7 +50,7 @@ async def ranmove2():
 
 
 
-async def main():
+def main():
     global oplayerx
     global oplayery
     global playerX
@@ -60,16 +60,16 @@ async def main():
             if event.type == pygame.QUIT:
                 running = False
         screen.fill((111,123,144))
-        await player(playerX,playerY)
-        await orbit(oplayerx,oplayery)
-        await ranmove()
-        await ranmove2()
+        player(playerX,playerY)
+        orbit(oplayerx,oplayery)
+        ranmove()
+        ranmove2()
         pygame.draw.line(screen,green, [playerX+1,playerY], [oplayerx,oplayery])
-        if playerY == oplayery:
-            await print('impact')
-        if playerX == oplayerx:
-            await print('impact')
+        dx = playerX - oplayerx
+        dy = playerY - oplayery
+        if dx*dx + dy*dy < impact_dist2:
+            print('impact')
         pygame.display.update()
+        clock.tick(60)
 
-asyncr = asyncio.run(main())
-asyncr
+main()